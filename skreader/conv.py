@@ -5,15 +5,62 @@ Based on original C-7000 SDK from Sekonic.
 Names are kept as close as possible to the original SDK.
 """
 
+import bisect
 import struct
 
+_FLOAT = struct.Struct(">f")
+_DOUBLE = struct.Struct(">d")
+
+# Precomputed FloatToStr() format specs for the common number of digits
+_FLOAT_FORMAT_SPECS = tuple(f".{ndigits}f" for ndigits in range(10))
+
+# LuxFloatToStr() rounding by value magnitude: values below each threshold are
+# rounded to the number of digits from _LUX_NDIGITS, then to the nearest
+# integer step from _LUX_INT_STEPS, larger values to the nearest thousand.
+_LUX_THRESHOLDS = (
+    9.9499998092651367,
+    99.949996948242188,
+    999.5,
+    9995.0,
+    99950.0,
+)
+_LUX_NDIGITS = (2, 1)
+_LUX_INT_STEPS = (1, 10, 100)
+
 
 def ParseFloat(data: bytes, pos: int) -> float:
-    return float(struct.unpack(">f", data[pos : pos + 4])[0])
+    return float(_FLOAT.unpack_from(data, pos)[0])
 
 
 def ParseDouble(data: bytes, pos: int) -> float:
-    return float(struct.unpack(">d", data[pos : pos + 8])[0])
+    return float(_DOUBLE.unpack_from(data, pos)[0])
+
+
+def ParseFloatArray(
+    data: bytes, pos: int, count: int, stride: int = 4
+) -> list[float]:
+    return _unpack_array("f", 4, data, pos, count, stride)
+
+
+def ParseDoubleArray(
+    data: bytes, pos: int, count: int, stride: int = 8
+) -> list[float]:
+    return _unpack_array("d", 8, data, pos, count, stride)
+
+
+def _unpack_array(
+    code: str, size: int, data: bytes, pos: int, count: int, stride: int
+) -> list[float]:
+    if count <= 0:
+        return []
+
+    if stride == size:
+        fmt = f">{count}{code}"
+    else:
+        # skip padding between values stored `stride` bytes apart
+        fmt = ">" + f"{code}{stride - size}x" * (count - 1) + code
+
+    return list(struct.unpack_from(fmt, data, pos))
 
 
 def FloatToStr(
@@ -25,21 +72,23 @@ def FloatToStr(
     if val > high_limit:
         return "Over"
 
+    if 0 <= ndigits < len(_FLOAT_FORMAT_SPECS):
+        return format(val, _FLOAT_FORMAT_SPECS[ndigits])
+
     return f"{val:.{ndigits}f}"
 
 
 def LuxFloatToStr(val: float, low_limit: float, high_limit: float) -> str:
-    if val < 9.9499998092651367:
-        val = round(val, 2)
-    elif val < 99.949996948242188:
-        val = round(val, 1)
-    elif val < 999.5:
-        val = round(val, 0)
-    elif val < 9995.0:
-        val = round(val / 10.0, 0) * 10.0
-    elif val < 99950.0:
-        val = round(val / 100.0, 0) * 100.0
+    idx = bisect.bisect_right(_LUX_THRESHOLDS, val)
+    if idx < len(_LUX_NDIGITS):
+        val = round(val, _LUX_NDIGITS[idx])
+    elif idx < len(_LUX_NDIGITS) + len(_LUX_INT_STEPS):
+        # These values are always >= 100 after rounding, so they are printed
+        # as integers. Same half-to-even rounding as round(val / step, 0).
+        step = _LUX_INT_STEPS[idx - len(_LUX_NDIGITS)]
+        val = round(val / step) * step
     else:
+        # kept in float as value may be inf or nan here
         val = round(val / 1000.0, 0) * 1000.0
 
     if val < low_limit:
@@ -48,6 +97,9 @@ def LuxFloatToStr(val: float, low_limit: float, high_limit: float) -> str:
     if val > high_limit:
         return "Over"
 
+    if isinstance(val, int):
+        return str(val)
+
     if val < 100.0:
         return f"{val:.1f}"
 
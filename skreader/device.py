@@ -25,6 +25,42 @@ SK_PRODUCT_ID = 0x7003  # SPECTROMASTER
 
 RESP_OK = bytes([6, 48])
 
+# device status decoding: only these sta_1 and sta_2 bits affect the status
+_STA_1_STATUS_MASK = 0x19
+_STA_2_STATUS_MASK = 0x1D
+
+
+def _decode_status(sta_1: int, sta_2: int) -> SKF_STATUS_DEVICE:
+    status = SKF_STATUS_DEVICE.IDLE
+    if sta_1 & 0x10 != 0:
+        status = SKF_STATUS_DEVICE.ERROR_HW
+    elif sta_1 & 1 != 0:
+        if sta_2 & 1 != 0:
+            status = SKF_STATUS_DEVICE.BUSY_INITIALIZING
+        elif sta_2 & 4 != 0:
+            status = SKF_STATUS_DEVICE.BUSY_DARK_CALIBRATION
+        elif sta_2 & 0x10 != 0:
+            status = SKF_STATUS_DEVICE.BUSY_FLASH_STANDBY
+        elif sta_2 & 8 != 0:
+            status = SKF_STATUS_DEVICE.BUSY_MEASURING
+    elif sta_1 & 8 != 0:
+        status = SKF_STATUS_DEVICE.IDLE_OUT_MEAS
+    return status
+
+
+# status for every combination of the masked bits, keyed by sta_1 << 8 | sta_2
+_STATUS_BY_BITS = {
+    sta_1 << 8 | sta_2: _decode_status(sta_1, sta_2)
+    for sta_1 in range(_STA_1_STATUS_MASK + 1)
+    if sta_1 & ~_STA_1_STATUS_MASK == 0
+    for sta_2 in range(_STA_2_STATUS_MASK + 1)
+    if sta_2 & ~_STA_2_STATUS_MASK == 0
+}
+
+# key status byte decoding: button in bits 0-4, ring position in bits 5-6
+_BUTTON_BY_VALUE = {button.value: button for button in SKF_STATUS_BUTTON}
+_RING_BY_VALUE = {ring.value: ring for ring in SKF_STATUS_RING}
+
 
 class DeviceNotFoundError(Exception):
     pass
@@ -162,42 +198,25 @@ class Device:
 
     def cmd_get_device_info(self) -> DeviceInfo:
         data = self.run_cmd_or_error("ST", errmsg="cmd_get_device_info")
-        if len(data[2:]) != 3:
+        # 2 command bytes followed by sta_1, sta_2 and key status bytes
+        try:
+            _, _, sta_1, sta_2, key = data
+        except ValueError:
             raise CommandError("cmd_get_device_info")
 
-        sta_1 = data[2]
-        sta_2 = data[3]
-        key = data[4]
-
-        status = SKF_STATUS_DEVICE.IDLE
-        if sta_1 & 0x10 != 0:
-            status = SKF_STATUS_DEVICE.ERROR_HW
-        elif sta_1 & 1 != 0:
-            if sta_2 & 1 != 0:
-                status = SKF_STATUS_DEVICE.BUSY_INITIALIZING
-            elif sta_2 & 4 != 0:
-                status = SKF_STATUS_DEVICE.BUSY_DARK_CALIBRATION
-            elif sta_2 & 0x10 != 0:
-                status = SKF_STATUS_DEVICE.BUSY_FLASH_STANDBY
-            elif sta_2 & 8 != 0:
-                status = SKF_STATUS_DEVICE.BUSY_MEASURING
-        elif sta_1 & 8 != 0:
-            status = SKF_STATUS_DEVICE.IDLE_OUT_MEAS
+        status = _STATUS_BY_BITS[
+            (sta_1 & _STA_1_STATUS_MASK) << 8 | (sta_2 & _STA_2_STATUS_MASK)
+        ]
 
         if (sta_1 & 2) == 0:
             remote = SKF_REMOTE.REMOTE_OFF
         else:
             remote = SKF_REMOTE.REMOTE_ON
 
-        try:
-            button = SKF_STATUS_BUTTON(key & 0x1F)
-        except ValueError:
-            button = SKF_STATUS_BUTTON.NONE
-
-        try:
-            ring = SKF_STATUS_RING((key & 0x60) >> 5)
-        except ValueError:
-            ring = SKF_STATUS_RING.UNPOSITIONED
+        button = _BUTTON_BY_VALUE.get(key & 0x1F, SKF_STATUS_BUTTON.NONE)
+        ring = _RING_BY_VALUE.get(
+            (key & 0x60) >> 5, SKF_STATUS_RING.UNPOSITIONED
+        )
 
         return DeviceInfo(
             status=status,
@@ -5,14 +5,22 @@ Based on original C-7000 SDK from Sekonic.
 Names are kept as close as possible to the original SDK.
 """
 
+import struct
 from dataclasses import dataclass, field
 from typing import NewType
 
-from .conv import FloatToStr, LuxFloatToStr, ParseDouble, ParseFloat
+from .conv import (
+    FloatToStr,
+    LuxFloatToStr,
+    ParseDoubleArray,
+    ParseFloatArray,
+)
 
 
 @dataclass
 class TristimulusValue:
+    __slots__ = ("X", "Y", "Z")
+
     X: str
     Y: str
     Z: str
@@ -36,30 +44,40 @@ class CIE1931Value:
 
 @dataclass
 class CIE1976Value:
+    __slots__ = ("ud", "vd")
+
     ud: str
     vd: str
 
 
 @dataclass
 class ColorRenditionIndexesValue:
+    __slots__ = ("Ra", "Ri")
+
     Ra: str
     Ri: list[str]
 
 
 @dataclass
 class IlluminanceValue:
+    __slots__ = ("Lux", "FootCandle")
+
     Lux: str
     FootCandle: str
 
 
 @dataclass
 class DominantWavelengthValue:
+    __slots__ = ("Wavelength", "ExcitationPurity")
+
     Wavelength: str
     ExcitationPurity: str
 
 
 @dataclass
 class ColorTemperatureValue:
+    __slots__ = ("Tcp", "Delta_uv")
+
     Tcp: str
     Delta_uv: str
 
@@ -74,6 +92,38 @@ PeakWavelengthValue = NewType("PeakWavelengthValue", str)
 # TM30, SSI, TLCI
 
 
+# Single values of the measurement data as (offset, struct format) pairs,
+# decoded together by _MEAS_VALUES to avoid a struct call per value.
+# Evenly spaced runs (XYZ, Ri, spectra) are decoded with the conv array parsers.
+_MEAS_VALUE_FIELDS = (
+    (50, "f"),  # Tcp
+    (55, "f"),  # Delta_uv
+    (271, "f"),  # Lux
+    (276, "f"),  # FootCandle
+    (308, "f"),  # x
+    (313, "f"),  # y
+    (328, "f"),  # ud
+    (333, "f"),  # vd
+    (338, "f"),  # Wavelength
+    (343, "f"),  # ExcitationPurity
+    (348, "f"),  # Ra
+    (2376, "f"),  # PPFD
+)
+
+
+def _fields_struct(fields: tuple[tuple[int, str], ...]) -> struct.Struct:
+    fmt = ">"
+    pos = 0
+    for offset, code in fields:
+        # skip bytes between the previous value and this one
+        fmt += f"{offset - pos}x{code}"
+        pos = offset + struct.calcsize(code)
+    return struct.Struct(fmt)
+
+
+_MEAS_VALUES = _fields_struct(_MEAS_VALUE_FIELDS)
+
+
 @dataclass(init=False)
 class MeasurementResult:
     """
@@ -83,6 +133,21 @@ class MeasurementResult:
     as Windows DLL).
     """
 
+    __slots__ = (
+        "Tristimulus",
+        "CIE1931",
+        "CIE1976",
+        "ColorTemperature",
+        "ColorRenditionIndexes",
+        "Illuminance",
+        "DWL",
+        "PPFD",
+        "PeakWavelength",
+        "SpectralData_1nm",
+        "SpectralData_5nm",
+        "LimFlag",
+    )
+
     Tristimulus: TristimulusValue  # Tristimulus values in XYZ color space
     CIE1931: CIE1931Value  # CIE 1931 (x, y, z) chromaticity coordinates
     CIE1976: CIE1976Value  # CIE 1976 (u', v') chromaticity coordinates
@@ -104,10 +169,25 @@ class MeasurementResult:
                 f"Invalid measurement data size {len(data)} != 2380"
             )
 
+        (
+            tcp,
+            delta_uv,
+            lux,
+            foot_candle,
+            x,
+            y,
+            ud,
+            vd,
+            wavelength,
+            excitation_purity,
+            ra,
+            ppfd,
+        ) = _MEAS_VALUES.unpack_from(data)
+
         # SKF_MEASURING_MODE.AMBIENT only!
         self.ColorTemperature = ColorTemperatureValue(
-            Tcp=FloatToStr(ParseFloat(data, 50), 1563, 100000, 0),
-            Delta_uv=FloatToStr(ParseFloat(data, 55), -0.1, 0.1, 4),
+            Tcp=FloatToStr(tcp, 1563, 100000, 0),
+            Delta_uv=FloatToStr(delta_uv, -0.1, 0.1, 4),
         )
         # Limit the CCT value (SK C-800 returns Tcp=50000 value instead of
         # "Over" as C-7000 does)
@@ -116,40 +196,41 @@ class MeasurementResult:
 
         # SKF_MEASURING_MODE.AMBIENT only!
         self.Illuminance = IlluminanceValue(
-            Lux=LuxFloatToStr(ParseFloat(data, 271), 100, 200000),
+            Lux=LuxFloatToStr(lux, 100, 200000),
             FootCandle=LuxFloatToStr(
-                ParseFloat(data, 276),
+                foot_candle,
                 0.093000002205371857,
                 18580.607421875,
             ),
         )
 
+        tri_x, tri_y, tri_z = ParseDoubleArray(data, 281, 3, stride=9)
         self.Tristimulus = TristimulusValue(
-            X=FloatToStr(ParseDouble(data, 281), 0, 1000000, 4),
-            Y=FloatToStr(ParseDouble(data, 290), 0, 1000000, 4),
-            Z=FloatToStr(ParseDouble(data, 299), 0, 1000000, 4),
+            X=FloatToStr(tri_x, 0, 1000000, 4),
+            Y=FloatToStr(tri_y, 0, 1000000, 4),
+            Z=FloatToStr(tri_z, 0, 1000000, 4),
         )
 
         self.CIE1931 = CIE1931Value(
-            x=FloatToStr(ParseFloat(data, 308), 0, 1, 4),
-            y=FloatToStr(ParseFloat(data, 313), 0, 1, 4),
+            x=FloatToStr(x, 0, 1, 4),
+            y=FloatToStr(y, 0, 1, 4),
         )
 
         self.CIE1976 = CIE1976Value(
-            ud=FloatToStr(ParseFloat(data, 328), 0, 1, 4),
-            vd=FloatToStr(ParseFloat(data, 333), 0, 1, 4),
+            ud=FloatToStr(ud, 0, 1, 4),
+            vd=FloatToStr(vd, 0, 1, 4),
         )
 
         self.DWL = DominantWavelengthValue(
-            Wavelength=FloatToStr(ParseFloat(data, 338), -780, 780, 0),
-            ExcitationPurity=FloatToStr(ParseFloat(data, 343), 0, 100, 1),
+            Wavelength=FloatToStr(wavelength, -780, 780, 0),
+            ExcitationPurity=FloatToStr(excitation_purity, 0, 100, 1),
         )
 
         self.ColorRenditionIndexes = ColorRenditionIndexesValue(
-            Ra=FloatToStr(ParseFloat(data, 348), -100, 100, 1),
+            Ra=FloatToStr(ra, -100, 100, 1),
             Ri=[
-                FloatToStr(ParseFloat(data, 353 + i * 5), -100, 100, 1)
-                for i in range(14)
+                FloatToStr(value, -100, 100, 1)
+                for value in ParseFloatArray(data, 353, 14, stride=5)
             ],
         )
 
@@ -168,12 +249,8 @@ class MeasurementResult:
             self.SpectralData_5nm = [9999.9] * 80
             self.SpectralData_1nm = [9999.9] * 400
         else:
-            self.SpectralData_5nm = [
-                ParseFloat(data, 428 + i * 4) for i in range(81)
-            ]
-            self.SpectralData_1nm = [
-                ParseFloat(data, 753 + i * 4) for i in range(401)
-            ]
+            self.SpectralData_5nm = ParseFloatArray(data, 428, 81)
+            self.SpectralData_1nm = ParseFloatArray(data, 753, 401)
             self.PeakWavelength = PeakWavelengthValue(
                 str(
                     380
@@ -182,7 +259,7 @@ class MeasurementResult:
             )
 
         self.PPFD = PhotosyntheticPhotonFluxDensityValue(
-            FloatToStr(ParseFloat(data, 2376), 0, 9999.9, 1)
+            FloatToStr(ppfd, 0, 9999.9, 1)
         )
 
         # Boundaries extra check
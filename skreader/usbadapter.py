@@ -4,6 +4,9 @@ USB driver interface.
 (to avoid pyusb specific calls spread through the main code)
 """
 
+import array
+import os
+
 import usb.util
 from usb import Device as _pyusbDevice
 from usb import Endpoint as _pyusbEndpoint
@@ -12,23 +15,39 @@ from usb.core import USBError as _pyusbUSBError
 from usb.core import USBTimeoutError as _pyusbUSBTimeoutError
 
 
-class NoBackendError(_pyusbNoBackendError): ...
+# pyusb errors re-exported as is, so that errors raised by pyusb are caught by
+# `except usbadapter.USBError` and friends
+NoBackendError = _pyusbNoBackendError
+USBError = _pyusbUSBError
+USBTimeoutError = _pyusbUSBTimeoutError
 
 
-class USBError(_pyusbUSBError): ...
+class Device(_pyusbDevice): ...
 
 
-class USBTimeoutError(_pyusbUSBTimeoutError): ...
+class Endpoint(_pyusbEndpoint): ...
 
 
-class Device(_pyusbDevice): ...
+# Every response fits into a single bulk transfer (the largest one, the
+# measurement result, is 2380 bytes) and a read completes on the first short
+# packet, so a bigger buffer does not reduce the number of transfers.
+# Can be overridden with SKREADER_READ_BUF_LEN env variable (in bytes).
+READ_BUF_LEN = int(os.environ.get("SKREADER_READ_BUF_LEN", 4160))
+READ_TIMEOUT_MS = 10000
 
 
-class Endpoint(_pyusbEndpoint): ...
+# Attribute of the pyusb device object holding the OUT endpoint found by
+# get_usb_out_endpoint().
+# The device topology does not change while it is connected, so the lookup is
+# done once per device object and dropped by dispose_resources().
+# Stored on the object itself rather than in a mapping keyed by device:
+# pyusb devices compare equal by bus/address, so a keyed cache would hand a
+# new device object the endpoint bound to an old one.
+_OUT_ENDPOINT_ATTR = "_skreader_out_endpoint"
 
 
-READ_BUF_LEN = 4160
-READ_TIMEOUT_MS = 10000
+# Read buffers reused by usb_read() to avoid allocating a new one per read.
+_read_buffers: "list[array.array[int]]" = []
 
 
 def get_usb_device(vendor_id: int, product_id: int) -> Device:
@@ -38,8 +57,27 @@ def get_usb_device(vendor_id: int, product_id: int) -> Device:
     )
 
 
+def _is_out_endpoint(endpoint: Endpoint) -> bool:
+    return (
+        usb.util.endpoint_direction(endpoint.bEndpointAddress)
+        == usb.util.ENDPOINT_OUT
+    )
+
+
 def get_usb_out_endpoint(device: Device) -> Endpoint:
-    cfg = device.get_active_configuration()
+    endpoint = getattr(device, _OUT_ENDPOINT_ATTR, None)
+    if endpoint is not None:
+        return endpoint
+
+    try:
+        cfg = device.get_active_configuration()
+    except USBError as e:
+        # pyusb raises "Configuration not set" with no errno for unconfigured
+        # device, any backend error (access denied, timeout, no device...)
+        # is a real failure which set_configuration() would only hide
+        if e.errno is not None:
+            raise
+        cfg = None
 
     if not cfg:
         # set the active configuration. With no arguments, the first
@@ -51,14 +89,15 @@ def get_usb_out_endpoint(device: Device) -> Endpoint:
     # get an endpoint instance
     intf = cfg[(0, 0)]
 
-    return usb.util.find_descriptor(
+    endpoint = usb.util.find_descriptor(
         intf,
         # match the first OUT endpoint
-        custom_match=lambda e: (
-            usb.util.endpoint_direction(e.bEndpointAddress)
-            == usb.util.ENDPOINT_OUT
-        ),
+        custom_match=_is_out_endpoint,
     )
+    if endpoint is not None:
+        setattr(device, _OUT_ENDPOINT_ATTR, endpoint)
+
+    return endpoint
 
 
 def usb_write(out_endpoint: Endpoint, cmd: str) -> None:
@@ -68,8 +107,30 @@ def usb_write(out_endpoint: Endpoint, cmd: str) -> None:
 def usb_read(
     device: Device, buf_len: int = READ_BUF_LEN, timeout: int = READ_TIMEOUT_MS
 ) -> bytes:
-    return device.read(0x81, buf_len, timeout)
+    try:
+        buf = _read_buffers.pop()
+    except IndexError:
+        buf = None
+
+    if buf is None or len(buf) != buf_len:
+        buf = array.array("B", bytes(buf_len))
+
+    try:
+        read_len = usb_read_into(device, buf, timeout)
+        return memoryview(buf)[:read_len].tobytes()
+    finally:
+        _read_buffers.append(buf)
+
+
+# Reads data into the given buffer in place and returns the read length.
+# Buffer must be an array of bytes (pyusb does not accept other buffer types).
+def usb_read_into(
+    device: Device, buf: "array.array[int]", timeout: int = READ_TIMEOUT_MS
+) -> int:
+    return device.read(0x81, buf, timeout)
 
 
 def dispose_resources(device: Device) -> None:
+    if hasattr(device, _OUT_ENDPOINT_ATTR):
+        delattr(device, _OUT_ENDPOINT_ATTR)
     usb.util.dispose_resources(device)
@@ -2,10 +2,11 @@
 Shared fixtures for pytest tests.
 """
 
-from typing import Any, Dict, Generator
+from types import MappingProxyType
+from typing import Any, Dict, Generator, Mapping
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 from skreader.testdata import ret_ok, ret_under_1, ret_under_2
 from skreader.device import DeviceInfo, MeasConfig
@@ -21,54 +22,70 @@ from skreader.const import (
 )
 
 
-@pytest.fixture
-def mock_device() -> Generator[MagicMock, None, None]:
-    """Fixture for mocking the Device class."""
-    with patch("skreader.controller.Device") as mock:
-        device_instance = mock.return_value
+def _reset_mock_device(device_instance: MagicMock) -> None:
+    """Reset the mocked Device instance to its default behaviors."""
+    device_instance.reset_mock(return_value=True, side_effect=True)
 
-        # Set up default behaviors
-        device_instance.model_name = "C-7000"
-        device_instance.fw_version = 27
-        device_instance.found = True
-        device_instance.is_connected = True
+    # Set up default behaviors
+    device_instance.model_name = "C-7000"
+    device_instance.fw_version = 27
+    device_instance.found = True
+    device_instance.is_connected = True
+
+    # Mock device info response for ready device
+    device_instance.cmd_get_device_info.return_value = DeviceInfo(
+        status=SKF_STATUS_DEVICE.IDLE,
+        remote=SKF_REMOTE.REMOTE_OFF,
+        button=SKF_STATUS_BUTTON.NONE,
+        ring=SKF_STATUS_RING.LOW,
+    )
+
+    # Mock measurement result
+    device_instance.cmd_get_measuring_result.return_value.return_value = (
+        ret_ok
+    )
 
-        # Mock device info response for ready device
-        device_instance.cmd_get_device_info.return_value = DeviceInfo(
-            status=SKF_STATUS_DEVICE.IDLE,
-            remote=SKF_REMOTE.REMOTE_OFF,
-            button=SKF_STATUS_BUTTON.NONE,
-            ring=SKF_STATUS_RING.LOW,
-        )
 
-        # Mock measurement result
-        device_instance.cmd_get_measuring_result.return_value.return_value = (
-            ret_ok
-        )
+@pytest.fixture(scope="module")
+def _mock_device_instance() -> MagicMock:
+    """Fixture building the mocked Device instance once per test module."""
+    return MagicMock()
 
-        yield device_instance
+
+@pytest.fixture
+def mock_device(
+    _mock_device_instance: MagicMock,
+) -> Generator[MagicMock, None, None]:
+    """Fixture for mocking the Device class."""
+    # Patch per test so tests not using this fixture get the real Device
+    _reset_mock_device(_mock_device_instance)
+    with patch(
+        "skreader.controller.Device", return_value=_mock_device_instance
+    ):
+        yield _mock_device_instance
 
 
 @pytest.fixture
 def mock_usb_device() -> Generator[Dict[str, Any], None, None]:
     """Fixture for mocking USB device operations."""
-    with (
-        patch("skreader.usbadapter.get_usb_device") as mock_get_device,
-        patch("skreader.usbadapter.get_usb_out_endpoint") as mock_get_endpoint,
-        patch("skreader.usbadapter.usb_write") as mock_write,
-        patch("skreader.usbadapter.usb_read") as mock_read,
-        patch("skreader.usbadapter.dispose_resources") as mock_dispose,
-    ):
+    with patch.multiple(
+        "skreader.usbadapter",
+        get_usb_device=DEFAULT,
+        get_usb_out_endpoint=DEFAULT,
+        usb_write=DEFAULT,
+        usb_read=DEFAULT,
+        dispose_resources=DEFAULT,
+    ) as mocks:
 
         # Set up default behaviors
         mock_device = MagicMock()
         mock_endpoint = MagicMock()
 
-        mock_get_device.return_value = mock_device
-        mock_get_endpoint.return_value = mock_endpoint
+        mocks["get_usb_device"].return_value = mock_device
+        mocks["get_usb_out_endpoint"].return_value = mock_endpoint
 
         # Set up the read values for successful command acknowledgement
-        mock_read.side_effect = [
+        mocks["usb_read"].side_effect = [
             bytes([6, 48]),  # Command acknowledge
             b"MN@@@C-7000",  # Model name
         ]
@@ -76,18 +93,21 @@ def mock_usb_device() -> Generator[Dict[str, Any], None, None]:
         yield {
             "device": mock_device,
             "endpoint": mock_endpoint,
-            "get_device": mock_get_device,
-            "get_endpoint": mock_get_endpoint,
-            "write": mock_write,
-            "read": mock_read,
-            "dispose": mock_dispose,
+            "get_device": mocks["get_usb_device"],
+            "get_endpoint": mocks["get_usb_out_endpoint"],
+            "write": mocks["usb_write"],
+            "read": mocks["usb_read"],
+            "dispose": mocks["dispose_resources"],
         }
 
 
-@pytest.fixture
-def measurement_data() -> Dict[str, bytes]:
+@pytest.fixture(scope="module")
+def measurement_data() -> Mapping[str, bytes]:
     """Fixture providing different measurement data samples."""
-    return {"normal": ret_ok, "under_1": ret_under_1, "under_2": ret_under_2}
+    # read-only as it is shared by all tests of the module
+    return MappingProxyType(
+        {"normal": ret_ok, "under_1": ret_under_1, "under_2": ret_under_2}
+    )
 
 
 @pytest.fixture
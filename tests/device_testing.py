@@ -2,17 +2,76 @@
 Stub implementations for testing the Device class.
 """
 
+from typing import Iterable, Tuple, Union
 from unittest.mock import MagicMock
 
-from skreader.device import Device, MeasConfig, DeviceInfo, CommandError
-from skreader.const import (
-    SKF_STATUS_DEVICE,
-    SKF_REMOTE,
-    SKF_STATUS_BUTTON,
-    SKF_STATUS_RING,
+from skreader import usbadapter
+from skreader.device import Device, MeasConfig
+
+
+# Predefined responses returned by StubDevice.run_cmd_or_error()
+_CMD_RESPONSES = {
+    "MN": b"MN@@@C-7000",
+    "FV": b"FV@@@20,C36E,27,7881,11,B216,14,50CC,17,74EC",
+    # Status: IDLE, remote off, no button, CAL ring (0x20 in bits 5-6)
+    "ST": bytes([83, 84, 0, 0, 0x20]),
+    "TEST": b"RESPONSE",
+}
+_DEFAULT_RESPONSE = b"DEFAULT"
+
+
+# USB traffic recorded from a C-7000 during Device() initialization
+C7000_INIT_TRACE = (
+    ("write", "MN"),
+    ("read", bytes([6, 48])),
+    ("read", b"MN@@@C-7000"),
+    ("write", "FV"),
+    ("read", bytes([6, 48])),
+    ("read", b"FV@@@20,C36E,27,7881,11,B216,14,50CC,17,74EC"),
 )
 
 
+class ReplayUSB:
+    """
+    Replays recorded USB traffic in place of usbadapter write/read calls.
+
+    Each write must match the next recorded write, each read returns the
+    next recorded read.
+    """
+
+    def __init__(self, trace: Iterable[Tuple[str, Union[str, bytes]]]) -> None:
+        self.trace = list(trace)
+        self.pos = 0
+
+    def _next(self, op: str) -> Union[str, bytes]:
+        assert self.pos < len(self.trace), f"unexpected {op} past trace end"
+        recorded_op, data = self.trace[self.pos]
+        assert recorded_op == op, f"expected {recorded_op}, got {op}"
+        self.pos += 1
+        return data
+
+    def usb_write(self, endpoint: usbadapter.Endpoint, cmd: str) -> None:
+        """Check the written command against the recorded one."""
+        recorded = self._next("write")
+        assert cmd == recorded, f"expected write {recorded!r}, got {cmd!r}"
+
+    def usb_read(
+        self,
+        device: usbadapter.Device,
+        buf_len: int = usbadapter.READ_BUF_LEN,
+        timeout: int = usbadapter.READ_TIMEOUT_MS,
+    ) -> bytes:
+        """Return the next recorded read."""
+        data = self._next("read")
+        assert isinstance(data, bytes)
+        return data
+
+    @property
+    def done(self) -> bool:
+        """Return whether the whole trace has been replayed."""
+        return self.pos == len(self.trace)
+
+
 class StubDevice(Device):
     """
     A stub implementation of Device that doesn't require actual USB hardware.
@@ -62,68 +121,9 @@ class StubDevice(Device):
         Mock implementation that returns predefined values for commands.
 
         This avoids the need for actual USB communication.
+        Status ("ST") can be overridden in tests by patching run_cmd_or_error.
         """
-        if cmd == "MN":
-            return b"MN@@@C-7000"
-        elif cmd == "FV":
-            fw_data = b"FV@@@20,C36E,27,7881,11,B216,14,50CC,17,74EC"
-            return fw_data
-        elif cmd == "ST":
-            # Status: IDLE, remote off, no button, LOW ring
-            # This can be overridden in tests by patching run_cmd_or_error
-            # The 0x20 sets the ring to LOW (bit 5)
-            return bytes([83, 84, 0, 0, 0x20])
-        elif cmd == "TEST":
-            return b"RESPONSE"
-        else:
-            return b"DEFAULT"
-
-    def cmd_get_device_info(self) -> DeviceInfo:
-        """Return a device info based on the response from run_cmd_or_error."""
-        data = self.run_cmd_or_error("ST", errmsg="cmd_get_device_info")
-        if len(data[2:]) != 3:
-            raise CommandError("cmd_get_device_info")
-
-        sta_1 = data[2]
-        sta_2 = data[3]
-        key = data[4]
-
-        status = SKF_STATUS_DEVICE.IDLE
-        if sta_1 & 0x10 != 0:
-            status = SKF_STATUS_DEVICE.ERROR_HW
-        elif sta_1 & 1 != 0:
-            if sta_2 & 1 != 0:
-                status = SKF_STATUS_DEVICE.BUSY_INITIALIZING
-            elif sta_2 & 4 != 0:
-                status = SKF_STATUS_DEVICE.BUSY_DARK_CALIBRATION
-            elif sta_2 & 0x10 != 0:
-                status = SKF_STATUS_DEVICE.BUSY_FLASH_STANDBY
-            elif sta_2 & 8 != 0:
-                status = SKF_STATUS_DEVICE.BUSY_MEASURING
-        elif sta_1 & 8 != 0:
-            status = SKF_STATUS_DEVICE.IDLE_OUT_MEAS
-
-        if (sta_1 & 2) == 0:
-            remote = SKF_REMOTE.REMOTE_OFF
-        else:
-            remote = SKF_REMOTE.REMOTE_ON
-
-        try:
-            button = SKF_STATUS_BUTTON(key & 0x1F)
-        except ValueError:
-            button = SKF_STATUS_BUTTON.NONE
-
-        try:
-            ring = SKF_STATUS_RING((key & 0x60) >> 5)
-        except ValueError:
-            ring = SKF_STATUS_RING.UNPOSITIONED
-
-        return DeviceInfo(
-            status=status,
-            remote=remote,
-            button=button,
-            ring=ring,
-        )
+        return _CMD_RESPONSES.get(cmd, _DEFAULT_RESPONSE)
 
     def close(self) -> None:
         """Close the connection."""
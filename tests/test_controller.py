@@ -40,30 +40,20 @@ class TestSekonic:
             assert sekonic.device is not None
             assert sekonic.device == mock_device
 
-    def test_connect_device_not_found(self) -> None:
-        """Test connection when device is not found."""
+    @pytest.mark.parametrize(
+        "error, match",
+        [
+            (DeviceNotFoundError("No device"), "SEKONIC not found"),
+            (USBEndpointNotFoundError("No endpoint"), "USB connection failed"),
+        ],
+    )
+    def test_connect_error(self, error: Exception, match: str) -> None:
+        """Test connection when device or USB endpoint is not found."""
         sekonic = Sekonic()
 
-        # Mock a failed connection due to device not found
-        with patch(
-            "skreader.controller.Device",
-            side_effect=DeviceNotFoundError("No device"),
-        ):
-            with pytest.raises(SekonicError, match="SEKONIC not found"):
-                sekonic.connect()
-
-            assert sekonic.device is None
-
-    def test_connect_usb_error(self) -> None:
-        """Test connection when USB endpoint is not found."""
-        sekonic = Sekonic()
-
-        # Mock a failed connection due to USB endpoint not found
-        with patch(
-            "skreader.controller.Device",
-            side_effect=USBEndpointNotFoundError("No endpoint"),
-        ):
-            with pytest.raises(SekonicError, match="USB connection failed"):
+        # Mock a failed connection
+        with patch("skreader.controller.Device", side_effect=error):
+            with pytest.raises(SekonicError, match=match):
                 sekonic.connect()
 
             assert sekonic.device is None
@@ -247,45 +237,43 @@ class TestSekonic:
                 # Remote mode should be turned off on timeout
                 mock_device.cmd_set_remote_mode_off.assert_called_once()
 
-    def test_wait_until_ready_ring_not_low(self, mock_device: Any) -> None:
-        """Test wait_until_ready when ring is not in LOW position."""
-        sekonic = Sekonic()
-        sekonic.device = mock_device
-
-        # Create a device info with ring not in LOW position
-        device_info = DeviceInfo(
-            status=SKF_STATUS_DEVICE.IDLE,
-            remote=SKF_REMOTE.REMOTE_OFF,
-            button=SKF_STATUS_BUTTON.NONE,
-            ring=SKF_STATUS_RING.HIGH,  # Not LOW
-        )
-        mock_device.cmd_get_device_info.return_value = device_info
-
-        with pytest.raises(
-            SekonicError, match="Ring is not set to LOW position"
-        ):
-            sekonic.wait_until_ready()
-
-        # Remote mode should be turned off when error occurs
-        mock_device.cmd_set_remote_mode_off.assert_called_once()
-
-    def test_wait_until_ready_measuring_button_pressed(
-        self, mock_device: Any
+    @pytest.mark.parametrize(
+        "button, ring, match",
+        [
+            (
+                SKF_STATUS_BUTTON.NONE,
+                SKF_STATUS_RING.HIGH,  # Not LOW
+                "Ring is not set to LOW position",
+            ),
+            (
+                SKF_STATUS_BUTTON.MEASURING,  # Measuring button pressed
+                SKF_STATUS_RING.LOW,
+                "Measuring button is pressed",
+            ),
+        ],
+    )
+    def test_wait_until_ready_not_ready(
+        self,
+        mock_device: Any,
+        button: SKF_STATUS_BUTTON,
+        ring: SKF_STATUS_RING,
+        match: str,
     ) -> None:
-        """Test wait_until_ready when measuring button is pressed."""
+        """
+        Test wait_until_ready when ring is not in LOW position or measuring
+        button is pressed.
+        """
         sekonic = Sekonic()
         sekonic.device = mock_device
 
-        # Create a device info with measuring button pressed
-        device_info = DeviceInfo(
+        mock_device.cmd_get_device_info.return_value = DeviceInfo(
             status=SKF_STATUS_DEVICE.IDLE,
             remote=SKF_REMOTE.REMOTE_OFF,
-            button=SKF_STATUS_BUTTON.MEASURING,  # Measuring button pressed
-            ring=SKF_STATUS_RING.LOW,
+            button=button,
+            ring=ring,
         )
-        mock_device.cmd_get_device_info.return_value = device_info
 
-        with pytest.raises(SekonicError, match="Measuring button is pressed"):
+        with pytest.raises(SekonicError, match=match):
             sekonic.wait_until_ready()
 
         # Remote mode should be turned off when error occurs
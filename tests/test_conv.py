@@ -9,18 +9,24 @@ from skreader.conv import (
     FloatToStr,
     LuxFloatToStr,
     ParseDouble,
+    ParseDoubleArray,
     ParseFloat,
+    ParseFloatArray,
 )
 
+# IEEE 754 big-endian encodings of the test values
+FLOAT_123_456 = b"\x42\xf6\xe9\x79"  # 123.456 as float32
+DOUBLE_123_456789 = b"\x40\x5e\xdd\x3c\x07\xee\x0b\x0b"  # as float64
+
 
 class TestConv(TestCase):
     """Test conversion functions from skreader.conv."""
 
     def test_parse_float(self) -> None:
         """Test the ParseFloat function."""
-        # Create a bytes object containing a float in big-endian format
+        # Bytes object containing a float in big-endian format
         test_float = 123.456
-        data = struct.pack(">f", test_float)
+        data = FLOAT_123_456
         # Add extra data to test position parameter
         full_data = b"prefix" + data + b"suffix"
         result = ParseFloat(full_data, 6)
@@ -29,14 +35,57 @@ class TestConv(TestCase):
 
     def test_parse_double(self) -> None:
         """Test the ParseDouble function."""
-        # Create a bytes object containing a double in big-endian format
+        # Bytes object containing a double in big-endian format
         test_double = 123.456789
-        data = struct.pack(">d", test_double)
+        data = DOUBLE_123_456789
         # Add extra data to test position parameter
         full_data = b"prefix" + data + b"suffix"
         result = ParseDouble(full_data, 6)
         self.assertAlmostEqual(result, test_double, places=8)
 
+    def test_parse_float_array(self) -> None:
+        """Test the ParseFloatArray function."""
+        # Create a bytes object containing floats in big-endian format
+        test_floats = [1.5, -2.25, 380.0]
+        data = struct.pack(">3f", *test_floats)
+        # Add extra data to test position parameter
+        full_data = b"prefix" + data + b"suffix"
+        result = ParseFloatArray(full_data, 6, 3)
+        self.assertEqual(result, test_floats)
+        # Must give the same values as ParseFloat one by one
+        self.assertEqual(
+            result, [ParseFloat(full_data, 6 + i * 4) for i in range(3)]
+        )
+
+    def test_parse_float_array_with_stride(self) -> None:
+        """Test the ParseFloatArray function with padded values."""
+        # Create floats separated by one padding byte
+        test_floats = [1.5, -2.25, 380.0]
+        data = b"|".join(struct.pack(">f", f) for f in test_floats)
+        full_data = b"prefix" + data + b"suffix"
+        result = ParseFloatArray(full_data, 6, 3, stride=5)
+        self.assertEqual(result, test_floats)
+
+        # No values requested gives no values, with or without padding
+        self.assertEqual(ParseFloatArray(full_data, 6, 0), [])
+        self.assertEqual(ParseFloatArray(full_data, 6, 0, stride=8), [])
+
+    def test_parse_double_array(self) -> None:
+        """Test the ParseDoubleArray function."""
+        # Create a bytes object containing doubles in big-endian format
+        test_doubles = [1.5, -2.25, 123.456789]
+        data = struct.pack(">3d", *test_doubles)
+        full_data = b"prefix" + data + b"suffix"
+        result = ParseDoubleArray(full_data, 6, 3)
+        self.assertEqual(result, test_doubles)
+
+        # Doubles separated by one padding byte
+        data = b"|".join(struct.pack(">d", d) for d in test_doubles)
+        full_data = b"prefix" + data + b"suffix"
+        result = ParseDoubleArray(full_data, 6, 3, stride=9)
+        self.assertEqual(result, test_doubles)
+        self.assertEqual(ParseDoubleArray(full_data, 6, 0, stride=9), [])
+
     def test_float_to_str(self) -> None:
         """Test the FloatToStr function with various inputs."""
         # Test normal case
@@ -60,6 +109,9 @@ class TestConv(TestCase):
         # Test over limit
         self.assertEqual(LuxFloatToStr(2000.0, 0.0, 1000.0), "Over")
 
+        # Test under limit in the integer rounding bands
+        self.assertEqual(LuxFloatToStr(500.6, 1000.0, 200000.0), "Under")
+
         # Test different ranges with their formatting
         # < 9.95 (2 decimal places in original rounding)
         self.assertEqual(LuxFloatToStr(9.25, 0.0, 1000.0), "9.2")
@@ -76,5 +128,10 @@ class TestConv(TestCase):
         # 9995 - 99950 (round to nearest 100)
         self.assertEqual(LuxFloatToStr(12345.6, 0.0, 100000.0), "12300")
 
+        # Halfway values are rounded to even as in the original SDK
+        self.assertEqual(LuxFloatToStr(1235.0, 0.0, 10000.0), "1240")
+        self.assertEqual(LuxFloatToStr(1245.0, 0.0, 10000.0), "1240")
+        self.assertEqual(LuxFloatToStr(500.5, 0.0, 1000.0), "500")
+
         # >= 99950 (round to nearest 1000)
         self.assertEqual(LuxFloatToStr(123456.7, 0.0, 1000000.0), "123000")
@@ -2,7 +2,13 @@
 Tests for the usbadapter module.
 """
 
-from unittest.mock import MagicMock, patch
+import array
+from types import SimpleNamespace
+from typing import Any, List, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+import usb.core  # type: ignore[import-untyped]
 
 from skreader import usbadapter
 from skreader.usbadapter import (
@@ -13,9 +19,76 @@ from skreader.usbadapter import (
     get_usb_out_endpoint,
     usb_write,
     usb_read,
+    usb_read_into,
     dispose_resources,
 )
 
+# Payloads shared by the write/read tests
+_WRITE_CMD = "TEST"
+_READ_DATA = b"DATA"
+
+# Stubs below stand in for pyusb devices and endpoints, so tests hold them
+# as Any where usbadapter.Device or usbadapter.Endpoint is expected.
+
+
+class _StubUSBDevice:
+    """USB device stub recording read() calls and returning fixed data."""
+
+    def __init__(self, data: bytes = b"") -> None:
+        self.data = data
+        self.reads: List[Tuple[int, "array.array[int]", int]] = []
+
+    def read(self, endpoint: int, buf: "array.array[int]", timeout: int) -> int:
+        self.reads.append((endpoint, buf, timeout))
+        buf[: len(self.data)] = array.array("B", self.data)
+        return len(self.data)
+
+
+class _StubConfigDevice:
+    """USB device stub that is configured by set_configuration()."""
+
+    def __init__(
+        self,
+        cfg: Any,
+        configured: bool = False,
+        unconfigured_error: Optional[Exception] = None,
+    ) -> None:
+        self.cfg = cfg
+        self.configured = configured
+        self.unconfigured_error = unconfigured_error
+        self.set_configuration_calls = 0
+        self.get_active_configuration_calls = 0
+
+    def get_active_configuration(self) -> Any:
+        self.get_active_configuration_calls += 1
+        if self.configured:
+            return self.cfg
+        if self.unconfigured_error is not None:
+            raise self.unconfigured_error
+        return None
+
+    def set_configuration(self) -> None:
+        self.set_configuration_calls += 1
+        self.configured = True
+
+
+class _StubBusDevice(_StubConfigDevice):
+    """Configured device stub comparing equal by bus and address as pyusb."""
+
+    def __init__(self, bus: int, address: int) -> None:
+        super().__init__({(0, 0): object()}, configured=True)
+        self.bus = bus
+        self.address = address
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _StubBusDevice) and (
+            self.bus,
+            self.address,
+        ) == (other.bus, other.address)
+
+    def __hash__(self) -> int:
+        return hash((self.bus, self.address))
+
 
 class TestUSBAdapter:
     """Tests for the usbadapter module."""
@@ -24,7 +97,7 @@ class TestUSBAdapter:
         """Test get_usb_device function."""
         with patch("usb.core.find") as mock_find:
             # Mock the usb.core.find call
-            device = MagicMock()
+            device = object()
             mock_find.return_value = device
 
             # Call the function
@@ -36,15 +109,10 @@ class TestUSBAdapter:
 
     def test_get_usb_out_endpoint_with_active_config(self) -> None:
         """Test get_usb_out_endpoint function when configuration is active."""
-        # Mock objects
-        device = MagicMock()
-        cfg = MagicMock()
-        intf = MagicMock()
-        endpoint = MagicMock()
-
-        # Set up the mocks
-        device.get_active_configuration.return_value = cfg
-        cfg.__getitem__.return_value = intf
+        # Configured device, configuration only has interface (0, 0)
+        intf = object()
+        device: Any = _StubConfigDevice({(0, 0): intf}, configured=True)
+        endpoint = object()
 
         with patch("usb.util.find_descriptor", return_value=endpoint):
             # Call the function
@@ -53,20 +121,34 @@ class TestUSBAdapter:
             # Verify results
             assert result == endpoint
             # Should not be called since config is active
-            device.set_configuration.assert_not_called()
-            cfg.__getitem__.assert_called_once_with((0, 0))
+            assert device.set_configuration_calls == 0
 
     def test_get_usb_out_endpoint_without_active_config(self) -> None:
         """Test get_usb_out_endpoint function when config is not active."""
-        # Mock objects
-        device = MagicMock()
-        cfg = MagicMock()
-        intf = MagicMock()
-        endpoint = MagicMock()
+        # Device returns None until configured, simulating no active config
+        intf = object()
+        device: Any = _StubConfigDevice({(0, 0): intf})
+        endpoint = object()
+
+        with patch("usb.util.find_descriptor", return_value=endpoint):
+            # Call the function
+            result = get_usb_out_endpoint(device)
+
+            # Verify results
+            assert result == endpoint
+            # Should be called to set the configuration
+            assert device.set_configuration_calls == 1
 
-        # Set up the mocks - first return None to simulate no active config
-        device.get_active_configuration.side_effect = [None, cfg]
-        cfg.__getitem__.return_value = intf
+    def test_get_usb_out_endpoint_not_configured(self) -> None:
+        """Test get_usb_out_endpoint function when device is unconfigured."""
+        # Device raises until configured, as pyusb does if configuration
+        # is not set
+        intf = object()
+        device: Any = _StubConfigDevice(
+            {(0, 0): intf},
+            unconfigured_error=USBError("Configuration not set"),
+        )
+        endpoint = object()
 
         with patch("usb.util.find_descriptor", return_value=endpoint):
             # Call the function
@@ -75,43 +157,137 @@ class TestUSBAdapter:
             # Verify results
             assert result == endpoint
             # Should be called to set the configuration
-            device.set_configuration.assert_called_once()
-            cfg.__getitem__.assert_called_once_with((0, 0))
+            assert device.set_configuration_calls == 1
+
+    def test_get_usb_out_endpoint_backend_error(self) -> None:
+        """Test get_usb_out_endpoint re-raises backend errors as is."""
+        # Backend errors carry an errno, unlike "Configuration not set"
+        error = USBError("Access denied (insufficient permissions)", errno=13)
+        device: Any = _StubConfigDevice(
+            {(0, 0): object()}, unconfigured_error=error
+        )
+
+        with pytest.raises(USBError) as exc_info:
+            get_usb_out_endpoint(device)
+
+        # Should not try to configure the device and hide the real cause
+        assert exc_info.value is error
+        assert device.set_configuration_calls == 0
+
+    def test_is_out_endpoint(self) -> None:
+        """Test OUT endpoint matching used by get_usb_out_endpoint."""
+        out_endpoint: Any = SimpleNamespace(bEndpointAddress=0x01)
+        in_endpoint: Any = SimpleNamespace(bEndpointAddress=0x81)
+        assert usbadapter._is_out_endpoint(out_endpoint)
+        assert not usbadapter._is_out_endpoint(in_endpoint)
+
+    def test_get_usb_out_endpoint_cached(self) -> None:
+        """Test get_usb_out_endpoint caches endpoint until disposed."""
+        # Configured device stub
+        device: Any = _StubConfigDevice({(0, 0): object()}, configured=True)
+        endpoint = object()
+
+        with (
+            patch("usb.util.find_descriptor", return_value=endpoint) as find,
+            patch("usb.util.dispose_resources"),
+        ):
+            # Second call should use the cached endpoint
+            assert get_usb_out_endpoint(device) == endpoint
+            assert get_usb_out_endpoint(device) == endpoint
+            find.assert_called_once()
+            assert device.get_active_configuration_calls == 1
+
+            # Disposing resources should drop the cached endpoint
+            dispose_resources(device)
+            assert get_usb_out_endpoint(device) == endpoint
+            assert find.call_count == 2
+
+    def test_get_usb_out_endpoint_cached_per_device_object(self) -> None:
+        """Test equal but distinct devices do not share a cached endpoint."""
+        # Same bus and address, e.g. a device reopened without close()
+        old_device: Any = _StubBusDevice(1, 5)
+        new_device: Any = _StubBusDevice(1, 5)
+        assert old_device == new_device
+        old_endpoint = object()
+        new_endpoint = object()
+
+        with patch(
+            "usb.util.find_descriptor", side_effect=[old_endpoint, new_endpoint]
+        ):
+            assert get_usb_out_endpoint(old_device) is old_endpoint
+            assert get_usb_out_endpoint(new_device) is new_endpoint
+
+            # Each device object keeps its own endpoint
+            assert get_usb_out_endpoint(old_device) is old_endpoint
+            assert get_usb_out_endpoint(new_device) is new_endpoint
 
     def test_usb_write(self) -> None:
         """Test usb_write function."""
-        # Mock endpoint
-        endpoint = MagicMock()
+        # Stub endpoint recording written commands
+        written: List[str] = []
+        endpoint: Any = SimpleNamespace(write=written.append)
 
         # Call the function
-        usb_write(endpoint, "TEST")
+        usb_write(endpoint, _WRITE_CMD)
 
         # Verify endpoint.write was called with the command
-        endpoint.write.assert_called_once_with("TEST")
+        assert written == [_WRITE_CMD]
 
     def test_usb_read(self) -> None:
         """Test usb_read function."""
-        # Mock device
-        device = MagicMock()
-        device.read.return_value = b"DATA"
+        # Stub device
+        device: Any = _StubUSBDevice(_READ_DATA)
 
         # Test with default parameters
         result = usb_read(device)
-        device.read.assert_called_once_with(
-            0x81, usbadapter.READ_BUF_LEN, usbadapter.READ_TIMEOUT_MS
-        )
-        assert result == b"DATA"
+        endpoint, buf, timeout = device.reads[-1]
+        assert endpoint == 0x81
+        # pyusb fills an array.array in place, usb_read returns bytes
+        assert isinstance(buf, array.array)
+        assert len(buf) == usbadapter.READ_BUF_LEN
+        assert timeout == usbadapter.READ_TIMEOUT_MS
+        assert type(result) is bytes
+        assert result == _READ_DATA
 
         # Test with custom parameters
-        device.read.reset_mock()
         result = usb_read(device, 1000, 5000)
-        device.read.assert_called_once_with(0x81, 1000, 5000)
-        assert result == b"DATA"
+        endpoint, buf, timeout = device.reads[-1]
+        assert endpoint == 0x81
+        assert len(buf) == 1000
+        assert timeout == 5000
+        assert result == _READ_DATA
+
+    def test_usb_read_into(self) -> None:
+        """Test usb_read_into function."""
+        # Stub device
+        device: Any = _StubUSBDevice(_READ_DATA)
+        buf = array.array("B", bytes(16))
+
+        # Test with default timeout
+        assert usb_read_into(device, buf) == 4
+        assert device.reads == [(0x81, buf, usbadapter.READ_TIMEOUT_MS)]
+        assert buf[:4] == array.array("B", _READ_DATA)
+
+        # Test with custom timeout
+        device.reads.clear()
+        assert usb_read_into(device, buf, 5000) == 4
+        assert device.reads == [(0x81, buf, 5000)]
+
+    def test_usb_read_reuses_buffer(self) -> None:
+        """Test usb_read reuses the read buffer between calls."""
+        device: Any = _StubUSBDevice()
+
+        usb_read(device)
+        usb_read(device)
+
+        first_buf = device.reads[0][1]
+        second_buf = device.reads[1][1]
+        assert first_buf is second_buf
 
     def test_dispose_resources(self) -> None:
         """Test dispose_resources function."""
-        # Mock device
-        device = MagicMock()
+        # Stub device
+        device: Any = _StubUSBDevice()
 
         with patch("usb.util.dispose_resources") as mock_dispose:
             # Call the function
@@ -120,8 +296,8 @@ class TestUSBAdapter:
             # Verify usb.util.dispose_resources was called with the device
             mock_dispose.assert_called_once_with(device)
 
-    def test_exception_classes(self) -> None:
-        """Test exception classes are properly subclassed."""
-        assert issubclass(NoBackendError, Exception)
-        assert issubclass(USBError, Exception)
-        assert issubclass(USBTimeoutError, Exception)
+    def test_exception_classes_are_pyusb_errors(self) -> None:
+        """Test exception classes are aliases of the pyusb errors."""
+        assert NoBackendError is usb.core.NoBackendError
+        assert USBError is usb.core.USBError
+        assert USBTimeoutError is usb.core.USBTimeoutError